@@ -0,0 +1,124 @@
+"""Plan catalog, built once at import.
+
+Prices are held as integer cents and delivery targets as whole SLA hours so
+orders can store numbers that MongoDB aggregates and indexes directly.
+Display strings and the /api/plans response body are derived here once
+instead of on every request.
+"""
+import json
+
+ONE_TIME = "one_time"
+MONTHLY = "month"
+
+
+class Plan:
+    """An immutable plan definition"""
+
+    __slots__ = (
+        "key",
+        "name",
+        "price_cents",
+        "billing_period",
+        "description",
+        "delivery",
+        "sla_hours",
+        "features",
+        "price",
+    )
+
+    def __init__(self, key, name, price_cents, billing_period, description, delivery, sla_hours, features):
+        values = {
+            "key": key,
+            "name": name,
+            "price_cents": price_cents,
+            "billing_period": billing_period,
+            "description": description,
+            "delivery": delivery,
+            "sla_hours": sla_hours,
+            "features": tuple(features),
+            "price": format_price(price_cents, billing_period),
+        }
+        for attr, value in values.items():
+            object.__setattr__(self, attr, value)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"Plan {self.key!r} is read-only")
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"Plan {self.key!r} is read-only")
+
+    def __repr__(self):
+        return f"Plan({self.key!r}, price_cents={self.price_cents}, billing_period={self.billing_period!r})"
+
+    def to_api(self):
+        """Public representation used by /api/plans"""
+        return {
+            "name": self.name,
+            "price": self.price,
+            "priceCents": self.price_cents,
+            "billingPeriod": self.billing_period,
+            "description": self.description,
+            "delivery": self.delivery,
+            "slaHours": self.sla_hours,
+            "features": list(self.features),
+        }
+
+    def order_fields(self):
+        """Plan fields copied onto each new order document"""
+        return {
+            "planName": self.name,
+            "price": self.price,
+            "priceCents": self.price_cents,
+            "billingPeriod": self.billing_period,
+            "description": self.description,
+            "delivery": self.delivery,
+            "slaHours": self.sla_hours,
+            "features": list(self.features),
+        }
+
+
+def format_price(price_cents, billing_period):
+    """Render integer cents as the display price, e.g. 2499 monthly -> "$24.99/mo" """
+    price = f"${price_cents // 100}.{price_cents % 100:02d}"
+    return price + "/mo" if billing_period == MONTHLY else price
+
+
+PLANS = {
+    plan.key: plan
+    for plan in (
+        Plan(
+            key="snap",
+            name="Snap",
+            price_cents=399,
+            billing_period=ONE_TIME,
+            description="1 full-length custom song with cover art",
+            delivery="2 hours",
+            sla_hours=2,
+            features=["1 custom song", "Simple cover art", "2-hour delivery", "No edits"],
+        ),
+        Plan(
+            key="snappack",
+            name="Snap Pack",
+            price_cents=999,
+            billing_period=ONE_TIME,
+            description="3 songs over 7 days",
+            delivery="48 hours each",
+            sla_hours=48,
+            features=["3 custom songs", "Different moods/vibes", "Cover art for each", "48-hour delivery"],
+        ),
+        Plan(
+            key="creator",
+            name="Creator Pack",
+            price_cents=2499,
+            billing_period=MONTHLY,
+            description="Up to 10 songs per month with extras",
+            delivery="Priority",
+            # "Priority" has no published number; a day is the internal target
+            sla_hours=24,
+            features=["Up to 10 songs/month", "AI stems", "Instrumentals", "TikTok clips", "Priority delivery"],
+        ),
+    )
+}
+
+# Serialized once; the catalog never changes while the process runs
+PLANS_PAYLOAD = json.dumps({"plans": {key: plan.to_api() for key, plan in PLANS.items()}}).encode()
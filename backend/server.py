@@ -1,18 +1,41 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional
+from contextlib import asynccontextmanager
 import uuid
 import os
-from datetime import datetime
-from pymongo import MongoClient
+import re
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, DESCENDING, MongoClient, WriteConcern
+from pymongo.errors import DuplicateKeyError
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
 import logging
+try:
+    from plan_catalog import PLANS, PLANS_PAYLOAD
+    from structured_logging import RequestLoggingMiddleware, configure_logging
+except ImportError:  # imported as backend.server from the repository root
+    from backend.plan_catalog import PLANS, PLANS_PAYLOAD
+    from backend.structured_logging import RequestLoggingMiddleware, configure_logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: JSON lines written by a background thread. LOG_SAMPLE_RATE
+# is the fraction of routine success logs kept; warnings and errors are always kept.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', '1.0'))
+configure_logging(level=LOG_LEVEL, sample_rate=LOG_SAMPLE_RATE)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="SongSnaps API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Make sure order indexes exist before serving traffic"""
+    try:
+        ensure_indexes(orders_collection)
+        logger.info("Order indexes are in place")
+    except Exception as e:
+        logger.error("Failed to create order indexes: %s", e)
+    yield
+
+app = FastAPI(title="SongSnaps API", version="1.0.0", lifespan=lifespan)
 
 # CORS configuration
 app.add_middleware(
@@ -23,15 +46,83 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request IDs and per-request status/latency logging
+app.add_middleware(RequestLoggingMiddleware, logger=logger)
+
 # MongoDB connection
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+
+# Read/write routing. Order writes and customer-facing reads stay on the
+# primary; dashboard/analytics reads may be served by secondaries.
+ORDER_WRITE_CONCERN = os.environ.get('ORDER_WRITE_CONCERN', 'majority')
+ANALYTICS_READ_PREFERENCE = os.environ.get('ANALYTICS_READ_PREFERENCE', 'secondaryPreferred')
+# Seconds a secondary may lag before it is skipped; MongoDB requires >= 90, -1 disables the bound
+ANALYTICS_MAX_STALENESS_SECONDS = int(os.environ.get('ANALYTICS_MAX_STALENESS_SECONDS', '90'))
+
+WRITE_CONCERN_PROFILES = {
+    'majority': WriteConcern(w='majority', j=True, wtimeout=5000),  # survives primary failover
+    'primary': WriteConcern(w=1, j=True),  # journaled on the primary only
+    'fast': WriteConcern(w=1),  # acknowledged by the primary, not journaled
+}
+
+READ_PREFERENCES = {
+    'primaryPreferred': PrimaryPreferred,
+    'secondary': Secondary,
+    'secondaryPreferred': SecondaryPreferred,
+    'nearest': Nearest,
+}
+
+def build_order_collections(database):
+    """Return (orders, analytics) handles for the orders collection.
+
+    `orders` reads from the primary and writes with the configured write
+    concern profile; `analytics` reads with the analytics read preference.
+    """
+    if ORDER_WRITE_CONCERN not in WRITE_CONCERN_PROFILES:
+        raise ValueError(f"Unknown ORDER_WRITE_CONCERN profile: {ORDER_WRITE_CONCERN}")
+
+    if ANALYTICS_READ_PREFERENCE == 'primary':
+        analytics_read_preference = Primary()
+    elif ANALYTICS_READ_PREFERENCE in READ_PREFERENCES:
+        # pymongo only rejects a too-small bound during server selection, i.e. on every read
+        if ANALYTICS_MAX_STALENESS_SECONDS != -1 and ANALYTICS_MAX_STALENESS_SECONDS < 90:
+            raise ValueError(
+                f"ANALYTICS_MAX_STALENESS_SECONDS must be -1 or at least 90, got {ANALYTICS_MAX_STALENESS_SECONDS}"
+            )
+        analytics_read_preference = READ_PREFERENCES[ANALYTICS_READ_PREFERENCE](
+            max_staleness=ANALYTICS_MAX_STALENESS_SECONDS
+        )
+    else:
+        raise ValueError(f"Unknown ANALYTICS_READ_PREFERENCE: {ANALYTICS_READ_PREFERENCE}")
+
+    orders = database.orders.with_options(
+        read_preference=Primary(),
+        write_concern=WRITE_CONCERN_PROFILES[ORDER_WRITE_CONCERN],
+    )
+    analytics = database.orders.with_options(read_preference=analytics_read_preference)
+    return orders, analytics
+
+def ensure_indexes(collection):
+    """Create the indexes used by order lookups, listing and search"""
+    # Order IDs are only 32 random bits, so uniqueness has to be enforced here
+    collection.create_index([("orderId", ASCENDING)], name="orderId", unique=True)
+    collection.create_index([("timestamp", DESCENDING)], name="timestamp")
+    collection.create_index([("plan", ASCENDING), ("timestamp", DESCENDING)], name="plan_timestamp")
+    collection.create_index([("status", ASCENDING), ("timestamp", DESCENDING)], name="status_timestamp")
+    collection.create_index([("fulfilled", ASCENDING), ("timestamp", DESCENDING)], name="fulfilled_timestamp")
+    collection.create_index([("fulfilled", ASCENDING), ("dueAt", ASCENDING)], name="fulfilled_dueAt")
+
 try:
     client = MongoClient(MONGO_URL)
     db = client.songsnaps
-    orders_collection = db.orders
-    logger.info("Connected to MongoDB successfully")
+    orders_collection, analytics_orders_collection = build_order_collections(db)
+    logger.info(
+        "Connected to MongoDB successfully (writes: %s, analytics reads: %s)",
+        ORDER_WRITE_CONCERN,
+        ANALYTICS_READ_PREFERENCE,
+    )
 except Exception as e:
-    logger.error(f"Failed to connect to MongoDB: {e}")
+    logger.error("Failed to connect to MongoDB: %s", e)
     raise
 
 # Pydantic models
@@ -42,33 +133,34 @@ class OrderResponse(BaseModel):
     orderId: str
     plan: str
     price: str
+    priceCents: int
     timestamp: datetime
     whatsappNumber: str
 
-# Plan pricing and details
-PLAN_DETAILS = {
-    'snap': {
-        'name': 'Snap',
-        'price': '$3.99',
-        'description': '1 full-length custom song with cover art',
-        'delivery': '2 hours',
-        'features': ['1 custom song', 'Simple cover art', '2-hour delivery', 'No edits']
-    },
-    'snappack': {
-        'name': 'Snap Pack',
-        'price': '$9.99',
-        'description': '3 songs over 7 days',
-        'delivery': '48 hours each',
-        'features': ['3 custom songs', 'Different moods/vibes', 'Cover art for each', '48-hour delivery']
-    },
-    'creator': {
-        'name': 'Creator Pack',
-        'price': '$24.99/mo',
-        'description': 'Up to 10 songs per month with extras',
-        'delivery': 'Priority',
-        'features': ['Up to 10 songs/month', 'AI stems', 'Instrumentals', 'TikTok clips', 'Priority delivery']
-    }
-}
+ORDER_ID_PREFIX = "SS-"
+ORDER_ID_ATTEMPTS = 5
+MAX_SEARCH_RESULTS = 200
+
+def new_order_id() -> str:
+    """Generate a short, customer-friendly order ID"""
+    return f"{ORDER_ID_PREFIX}{uuid.uuid4().hex[:8].upper()}"
+
+def order_id_prefix_pattern(prefix: str) -> str:
+    """Build an anchored, case-sensitive regex so MongoDB can use the orderId index.
+
+    Customers often quote IDs in lower case or without the "SS-" prefix, so
+    both are normalised before matching.
+    """
+    prefix = prefix.strip().upper()
+    if not prefix.startswith(ORDER_ID_PREFIX) and not ORDER_ID_PREFIX.startswith(prefix):
+        prefix = ORDER_ID_PREFIX + prefix
+    return "^" + re.escape(prefix)
+
+def to_stored_time(value: datetime) -> datetime:
+    """Convert a datetime to the naive local time orders are stored with (datetime.now())"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
 
 @app.get("/")
 async def root():
@@ -86,7 +178,7 @@ async def health_check():
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=500, detail="Service unhealthy")
 
 @app.post("/api/generate-order", response_model=OrderResponse)
@@ -94,41 +186,48 @@ async def generate_order(order_request: OrderRequest):
     """Generate a unique order ID and store order details"""
     try:
         # Validate plan
-        if order_request.plan not in PLAN_DETAILS:
+        plan = PLANS.get(order_request.plan)
+        if plan is None:
             raise HTTPException(status_code=400, detail="Invalid plan type")
         
-        plan_info = PLAN_DETAILS[order_request.plan]
-        
-        # Generate unique order ID
-        order_id = f"SS-{uuid.uuid4().hex[:8].upper()}"
-        
         # Create order document
+        timestamp = datetime.now()
         order_doc = {
-            "orderId": order_id,
             "plan": order_request.plan,
-            "planName": plan_info['name'],
-            "price": plan_info['price'],
-            "description": plan_info['description'],
-            "delivery": plan_info['delivery'],
-            "features": plan_info['features'],
-            "timestamp": datetime.now(),
+            **plan.order_fields(),
+            "timestamp": timestamp,
+            "dueAt": timestamp + timedelta(hours=plan.sla_hours),
             "status": "payment_confirmed",
             "whatsappNumber": "+1234567890",  # Replace with your actual WhatsApp number
             "fulfilled": False
         }
         
-        # Store in database
-        result = orders_collection.insert_one(order_doc)
+        # Store in database, drawing a new ID if the unique orderId index rejects it
+        for attempt in range(ORDER_ID_ATTEMPTS):
+            order_id = new_order_id()
+            order_doc["orderId"] = order_id
+            order_doc.pop("_id", None)
+            try:
+                result = orders_collection.insert_one(order_doc)
+                break
+            except DuplicateKeyError:
+                logger.warning("Order ID collision on %s, retrying", order_id)
+        else:
+            raise HTTPException(status_code=500, detail="Failed to create order")
         
         if not result.inserted_id:
             raise HTTPException(status_code=500, detail="Failed to create order")
         
-        logger.info(f"Order created successfully: {order_id} for plan: {order_request.plan}")
+        logger.info(
+            "Order created successfully",
+            extra={"orderId": order_id, "plan": order_request.plan, "sample": True},
+        )
         
         return OrderResponse(
             orderId=order_id,
             plan=order_request.plan,
-            price=plan_info['price'],
+            price=plan.price,
+            priceCents=plan.price_cents,
             timestamp=order_doc["timestamp"],
             whatsappNumber=order_doc["whatsappNumber"]
         )
@@ -136,7 +235,7 @@ async def generate_order(order_request: OrderRequest):
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"Error generating order: {e}")
+        logger.error("Error generating order: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/order/{order_id}")
@@ -156,7 +255,7 @@ async def get_order(order_id: str):
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"Error fetching order {order_id}: {e}")
+        logger.error("Error fetching order %s: %s", order_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/api/order/{order_id}/fulfill")
@@ -176,14 +275,14 @@ async def fulfill_order(order_id: str):
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Order not found")
         
-        logger.info(f"Order {order_id} marked as fulfilled")
+        logger.info("Order marked as fulfilled", extra={"orderId": order_id, "sample": True})
         
         return {"message": "Order fulfilled successfully", "orderId": order_id}
         
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"Error fulfilling order {order_id}: {e}")
+        logger.error("Error fulfilling order %s: %s", order_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/orders")
@@ -196,7 +295,7 @@ async def get_orders(limit: int = 50, fulfilled: Optional[bool] = None, plan: Op
         if plan is not None:
             query["plan"] = plan
         
-        orders = list(orders_collection.find(query).sort("timestamp", -1).limit(limit))
+        orders = list(analytics_orders_collection.find(query).sort("timestamp", -1).limit(limit))
         
         # Remove MongoDB _id from results
         for order in orders:
@@ -205,42 +304,104 @@ async def get_orders(limit: int = 50, fulfilled: Optional[bool] = None, plan: Op
         return {"orders": orders, "count": len(orders)}
         
     except Exception as e:
-        logger.error(f"Error fetching orders: {e}")
+        logger.error("Error fetching orders: %s", e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.get("/api/orders/search")
+async def search_orders(
+    orderId: Optional[str] = None,
+    plan: Optional[str] = None,
+    status: Optional[str] = None,
+    fulfilled: Optional[bool] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = 50,
+):
+    """Search orders by orderId prefix, plan, status and date range"""
+    try:
+        if limit < 1 or limit > MAX_SEARCH_RESULTS:
+            raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_SEARCH_RESULTS}")
+        if start is not None:
+            start = to_stored_time(start)
+        if end is not None:
+            end = to_stored_time(end)
+        if start is not None and end is not None and start > end:
+            raise HTTPException(status_code=400, detail="start must not be after end")
+
+        query = {}
+        if orderId:
+            query["orderId"] = {"$regex": order_id_prefix_pattern(orderId)}
+        if plan is not None:
+            query["plan"] = plan
+        if status is not None:
+            query["status"] = status
+        if fulfilled is not None:
+            query["fulfilled"] = fulfilled
+        if start is not None or end is not None:
+            query["timestamp"] = {}
+            if start is not None:
+                query["timestamp"]["$gte"] = start
+            if end is not None:
+                query["timestamp"]["$lte"] = end
+
+        # Fulfillers look up orders customers have just paid for, so read from the primary
+        orders = list(orders_collection.find(query).sort("timestamp", -1).limit(limit))
+
+        for order in orders:
+            order.pop('_id', None)
+
+        return {"orders": orders, "count": len(orders)}
+
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error("Error searching orders: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/stats")
 async def get_stats():
     """Get basic statistics"""
     try:
-        total_orders = orders_collection.count_documents({})
-        fulfilled_orders = orders_collection.count_documents({"fulfilled": True})
+        total_orders = analytics_orders_collection.count_documents({})
+        fulfilled_orders = analytics_orders_collection.count_documents({"fulfilled": True})
         pending_orders = total_orders - fulfilled_orders
         
-        # Count by plan type
-        snap_orders = orders_collection.count_documents({"plan": "snap"})
-        snappack_orders = orders_collection.count_documents({"plan": "snappack"})
-        creator_orders = orders_collection.count_documents({"plan": "creator"})
+        overdue_orders = analytics_orders_collection.count_documents(
+            {"fulfilled": False, "dueAt": {"$lt": datetime.now()}}
+        )
+        
+        # Count and revenue by plan type, summed from the stored priceCents
+        by_plan = {
+            row["_id"]: row
+            for row in analytics_orders_collection.aggregate([
+                {"$group": {"_id": "$plan", "orders": {"$sum": 1}, "revenueCents": {"$sum": "$priceCents"}}}
+            ])
+        }
         
         return {
             "totalOrders": total_orders,
             "fulfilledOrders": fulfilled_orders,
             "pendingOrders": pending_orders,
+            "overdueOrders": overdue_orders,
+            "revenueCents": sum(row["revenueCents"] for row in by_plan.values()),
             "planBreakdown": {
-                "snap": snap_orders,
-                "snappack": snappack_orders,
-                "creator": creator_orders
+                key: by_plan.get(key, {}).get("orders", 0) for key in PLANS
+            },
+            "revenueBreakdownCents": {
+                key: by_plan.get(key, {}).get("revenueCents", 0) for key in PLANS
             }
         }
         
     except Exception as e:
-        logger.error(f"Error fetching stats: {e}")
+        logger.error("Error fetching stats: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/plans")
 async def get_plans():
     """Get available plans and their details"""
-    return {"plans": PLAN_DETAILS}
+    return Response(content=PLANS_PAYLOAD, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Requests are logged by the middleware above
+    uvicorn.run(app, host="0.0.0.0", port=8001, access_log=False)
\ No newline at end of file
@@ -266,9 +266,7 @@ function App() {
             <div className="bg-white rounded-xl shadow-lg p-6">
               <h3 className="text-lg font-semibold text-gray-700 mb-2">Revenue</h3>
               <p className="text-3xl font-bold text-purple-600">
-                ${((adminData.stats.planBreakdown?.snap || 0) * 3.99 + 
-                   (adminData.stats.planBreakdown?.snappack || 0) * 9.99 + 
-                   (adminData.stats.planBreakdown?.creator || 0) * 24.99).toFixed(2)}
+                ${((adminData.stats.revenueCents || 0) / 100).toFixed(2)}
               </p>
             </div>
           </div>
@@ -0,0 +1,44 @@
+"""Add numeric pricing and SLA fields to orders created before the plan catalog.
+
+Older orders only carry the display price string. This sets priceCents,
+billingPeriod and slaHours from the current catalog and derives dueAt from
+each order's timestamp, so revenue and overdue stats include them. Orders
+that already have priceCents are left alone, so the script can be re-run.
+
+    MONGO_URL=mongodb://localhost:27017 python scripts/backfill_order_pricing.py
+"""
+import os
+import sys
+
+from pymongo import MongoClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from plan_catalog import PLANS  # noqa: E402
+
+
+def main():
+    client = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    orders = client.songsnaps.orders
+
+    for key, plan in PLANS.items():
+        result = orders.update_many(
+            {"plan": key, "priceCents": {"$exists": False}},
+            [
+                {
+                    "$set": {
+                        "priceCents": plan.price_cents,
+                        "billingPeriod": plan.billing_period,
+                        "slaHours": plan.sla_hours,
+                        "dueAt": {"$add": ["$timestamp", plan.sla_hours * 3600 * 1000]},
+                    }
+                }
+            ],
+        )
+        print(f"{key}: backfilled {result.modified_count} orders")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Measure the cost of a log call on the calling thread.
+
+Compares the old synchronous setup (logging.basicConfig writing formatted
+lines straight to the stream) with the structured queue pipeline, with and
+without sampling. Each scenario runs twice: against /dev/null, which
+isolates the CPU cost of logging, and against a sink that blocks on every
+write, like a stdout pipe whose log collector is falling behind.
+
+A second section measures whole in-process requests to a trivial FastAPI
+route with no request middleware, with RequestLoggingMiddleware, and with
+an equivalent @app.middleware("http") (BaseHTTPMiddleware) for reference.
+Request logs are sampled out there, so only the middleware cost is shown.
+
+    python scripts/benchmark_logging.py
+    python scripts/benchmark_logging.py --records 100000 --sample-rate 0.05 --sink-latency-us 200
+"""
+import argparse
+import asyncio
+import atexit
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from fastapi import FastAPI, Request  # noqa: E402
+
+from structured_logging import RequestLoggingMiddleware, configure_logging, request_id_var  # noqa: E402
+
+
+class SlowStream:
+    """Write sink that blocks for a fixed time per write"""
+
+    def __init__(self, latency_us):
+        self.latency = latency_us / 1_000_000
+
+    def write(self, text):
+        time.sleep(self.latency)
+
+    def flush(self):
+        pass
+
+
+def reset_root_logger():
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+
+def time_calls(logger, records, structured):
+    started = time.perf_counter()
+    for i in range(records):
+        order_id = f"SS-{i:08X}"
+        if structured:
+            logger.info("Order created successfully", extra={"orderId": order_id, "plan": "snap", "sample": True})
+        else:
+            logger.info(f"Order created successfully: {order_id} for plan: snap")
+    return (time.perf_counter() - started) / records * 1_000_000
+
+
+def build_app(middleware):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    logger = logging.getLogger("benchmark.requests")
+    if middleware == "asgi":
+        app.add_middleware(RequestLoggingMiddleware, logger=logger)
+    elif middleware == "base_http":
+        @app.middleware("http")
+        async def log_requests(request: Request, call_next):
+            token = request_id_var.set(request.headers.get("X-Request-ID") or "benchmark")
+            started = time.perf_counter()
+            try:
+                response = await call_next(request)
+            finally:
+                request_id_var.reset(token)
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            logger.info("Request completed", extra={"status": response.status_code, "durationMs": duration_ms, "sample": True})
+            return response
+    return app
+
+
+async def time_requests(app, requests):
+    """Drive the ASGI app directly so client overhead does not hide the middleware cost"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "server": ("benchmark", 80),
+        "client": ("127.0.0.1", 12345),
+    }
+
+    async def send(message):
+        pass
+
+    async def request():
+        messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+        async def receive():
+            return next(messages, {"type": "http.disconnect"})
+
+        await app(dict(scope), receive, send)
+
+    for _ in range(200):  # warm up
+        await request()
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request()
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000, help="log calls per scenario")
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="sample rate for the sampled scenario")
+    parser.add_argument("--sink-latency-us", type=float, default=50, help="per-write delay of the slow sink")
+    parser.add_argument("--requests", type=int, default=5_000, help="requests per middleware scenario")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    sinks = (
+        ("/dev/null", open(os.devnull, "w")),
+        (f"slow sink ({args.sink_latency_us:g}us/write)", SlowStream(args.sink_latency_us)),
+    )
+
+    for sink_label, stream in sinks:
+        results = {}
+
+        reset_root_logger()
+        logging.basicConfig(level=logging.INFO, stream=stream, force=True)
+        results["sync basicConfig"] = time_calls(logger, args.records, structured=False)
+
+        for label, rate in (("queue + JSON", 1.0), (f"queue + JSON, sampled {args.sample_rate:g}", args.sample_rate)):
+            reset_root_logger()
+            listener = configure_logging(level="INFO", sample_rate=rate, stream=stream)
+            results[label] = time_calls(logger, args.records, structured=True)
+            drain_started = time.perf_counter()
+            atexit.unregister(listener.stop)
+            listener.stop()
+            results[label + " (background drain)"] = (time.perf_counter() - drain_started) / args.records * 1_000_000
+
+        baseline = results["sync basicConfig"]
+        print(f"{sink_label}: {args.records} log calls per scenario, microseconds per call")
+        for label, per_call in results.items():
+            if label.endswith("(background drain)"):
+                print(f"  {label:<45} {per_call:8.2f} us  (off the hot path)")
+            else:
+                print(f"  {label:<45} {per_call:8.2f} us  ({per_call / baseline:.2f}x sync)")
+
+
+    reset_root_logger()
+    listener = configure_logging(level="INFO", sample_rate=0.0, stream=open(os.devnull, "w"))
+    results = {}
+    for label, middleware in (
+        ("no request middleware", None),
+        ("RequestLoggingMiddleware (ASGI)", "asgi"),
+        ("@app.middleware(\"http\")", "base_http"),
+    ):
+        results[label] = asyncio.run(time_requests(build_app(middleware), args.requests))
+    atexit.unregister(listener.stop)
+    listener.stop()
+
+    baseline = results["no request middleware"]
+    print(f"in-process requests, request logs sampled out: {args.requests} requests per scenario")
+    for label, per_request in results.items():
+        print(f"  {label:<45} {per_request:8.2f} us  (+{per_request - baseline:.2f} us per request)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Seeded latency benchmark for /api/orders/search.
+
+Seeds a scratch database with N synthetic orders (1,000,000 by default),
+creates the production indexes, checks that every benchmark query is
+answered by an index scan, then times the endpoint in-process and reports
+latency percentiles against a target.
+
+Needs a running MongoDB:
+
+    MONGO_URL=mongodb://localhost:27017 python scripts/benchmark_search.py
+    python scripts/benchmark_search.py --orders 100000 --target-ms 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient
+from pymongo import MongoClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import server  # noqa: E402
+
+PLANS = list(server.PLANS)
+START_TIME = datetime(2025, 1, 1)
+
+
+def seed_orders(collection, count, rng, batch_size=10000):
+    """Insert `count` synthetic orders spread over one year"""
+    collection.drop()
+    # orderId is unique, so draw the random 32-bit IDs without replacement
+    order_ids = iter(rng.sample(range(2 ** 32), count))
+    inserted = 0
+    while inserted < count:
+        batch = []
+        for _ in range(min(batch_size, count - inserted)):
+            plan = rng.choice(PLANS)
+            timestamp = START_TIME + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+            batch.append({
+                "orderId": f"SS-{next(order_ids):08X}",
+                "plan": plan,
+                **server.PLANS[plan].order_fields(),
+                "timestamp": timestamp,
+                "dueAt": timestamp + timedelta(hours=server.PLANS[plan].sla_hours),
+                "status": "payment_confirmed",
+                "fulfilled": rng.random() < 0.8,
+            })
+        collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    server.ensure_indexes(collection)
+
+
+def benchmark_cases(rng):
+    """Representative searches: (query params, equivalent MongoDB filter)"""
+    cases = []
+    for _ in range(20):
+        prefix = f"{rng.getrandbits(16):04X}"
+        cases.append((
+            {"orderId": prefix},
+            {"orderId": {"$regex": server.order_id_prefix_pattern(prefix)}},
+        ))
+    for _ in range(20):
+        plan = rng.choice(PLANS)
+        start = START_TIME + timedelta(days=rng.randrange(358))
+        end = start + timedelta(days=7)
+        cases.append((
+            {"plan": plan, "start": start.isoformat(), "end": end.isoformat()},
+            {"plan": plan, "timestamp": {"$gte": start, "$lte": end}},
+        ))
+    for _ in range(10):
+        cases.append(({"fulfilled": "false"}, {"fulfilled": False}))
+    return cases
+
+
+def uses_collection_scan(plan):
+    """True if a winning query plan contains a COLLSCAN stage"""
+    if plan.get("stage") == "COLLSCAN":
+        return True
+    children = plan.get("inputStages", []) + [plan[key] for key in ("inputStage", "queryPlan") if key in plan]
+    return any(uses_collection_scan(child) for child in children)
+
+
+def check_index_usage(collection, cases):
+    for _, query in cases:
+        explain = collection.find(query).sort("timestamp", -1).limit(50).explain()
+        if uses_collection_scan(explain["queryPlanner"]["winningPlan"]):
+            raise SystemExit(f"Query {query} falls back to a collection scan")
+
+
+async def time_searches(cases, rounds):
+    latencies = []
+    transport = ASGITransport(app=server.app)
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for _ in range(rounds):
+            for params, _ in cases:
+                started = time.perf_counter()
+                response = await client.get("/api/orders/search", params=params)
+                latencies.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1_000_000, help="number of orders to seed")
+    parser.add_argument("--rounds", type=int, default=5, help="times each query is repeated")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for data and queries")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="p95 latency target in milliseconds")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded database afterwards")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    client = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    database = client.songsnaps_benchmark
+    server.orders_collection, server.analytics_orders_collection = server.build_order_collections(database)
+
+    try:
+        print(f"Seeding {args.orders} orders...")
+        started = time.perf_counter()
+        seed_orders(server.orders_collection, args.orders, rng)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+        cases = benchmark_cases(rng)
+        check_index_usage(server.orders_collection, cases)
+        print("All benchmark queries use indexes")
+
+        latencies = sorted(asyncio.run(time_searches(cases, args.rounds)))
+        p50 = statistics.median(latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"{len(latencies)} searches: p50={p50:.2f}ms p95={p95:.2f}ms p99={p99:.2f}ms max={latencies[-1]:.2f}ms")
+
+        if p95 > args.target_ms:
+            print(f"FAIL: p95 above {args.target_ms}ms target")
+            sys.exit(1)
+        print(f"OK: p95 within {args.target_ms}ms target")
+    finally:
+        if not args.keep:
+            client.drop_database(database.name)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
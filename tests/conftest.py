@@ -0,0 +1,35 @@
+import os
+import sys
+
+import mongomock
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+# Make backend/server.py importable as `server`
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "backend"))
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+def orders_collection(monkeypatch):
+    """Isolated in-memory orders collection, fresh for every test"""
+    orders, analytics = server.build_order_collections(mongomock.MongoClient().songsnaps)
+    server.ensure_indexes(orders)
+    monkeypatch.setattr(server, "orders_collection", orders)
+    monkeypatch.setattr(server, "analytics_orders_collection", analytics)
+    return orders
+
+
+@pytest.fixture
+async def client(orders_collection):
+    """Async HTTP client talking to the FastAPI app in-process"""
+    transport = ASGITransport(app=server.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
@@ -0,0 +1,228 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_order(client, plan):
+    response = await client.post("/api/generate-order", json={"plan": plan})
+    assert response.status_code == 200, f"Order generation for {plan} should return 200"
+    return response.json()
+
+
+async def test_health_check(client):
+    """Test the health check endpoint"""
+    response = await client.get("/api/health")
+
+    assert response.status_code == 200, "Health check should return 200"
+    data = response.json()
+    assert data["status"] == "healthy", "Health status should be 'healthy'"
+    assert data["database"] == "connected", "Database should be 'connected'"
+    assert "timestamp" in data, "Response should include timestamp"
+
+
+async def test_get_plans(client):
+    """Test the plans endpoint"""
+    response = await client.get("/api/plans")
+
+    assert response.status_code == 200, "Plans endpoint should return 200"
+    data = response.json()
+    assert "plans" in data, "Response should include plans"
+
+    plans = data["plans"]
+    assert set(plans) == {"snap", "snappack", "creator"}
+
+    assert plans["snap"]["name"] == "Snap"
+    assert plans["snap"]["price"] == "$3.99"
+    assert plans["snap"]["delivery"] == "2 hours"
+
+    assert plans["snappack"]["name"] == "Snap Pack"
+    assert plans["snappack"]["price"] == "$9.99"
+    assert plans["snappack"]["delivery"] == "48 hours each"
+
+    assert plans["creator"]["name"] == "Creator Pack"
+    assert plans["creator"]["price"] == "$24.99/mo"
+    assert plans["creator"]["delivery"] == "Priority"
+
+    assert {key: plan["priceCents"] for key, plan in plans.items()} == {
+        "snap": 399,
+        "snappack": 999,
+        "creator": 2499,
+    }
+    assert plans["creator"]["billingPeriod"] == "month"
+    assert plans["snap"]["slaHours"] == 2
+
+
+@pytest.mark.parametrize(
+    "plan, price, price_cents, sla_hours",
+    [("snap", "$3.99", 399, 2), ("snappack", "$9.99", 999, 48), ("creator", "$24.99/mo", 2499, 24)],
+)
+async def test_generate_order(client, orders_collection, plan, price, price_cents, sla_hours):
+    """Test order generation endpoint for each plan"""
+    data = await create_order(client, plan)
+
+    assert data["orderId"].startswith("SS-"), "Order ID should use the SS- prefix"
+    assert data["plan"] == plan
+    assert data["price"] == price
+    assert data["priceCents"] == price_cents
+    assert "timestamp" in data, "Response should include timestamp"
+    assert "whatsappNumber" in data, "Response should include whatsappNumber"
+
+    stored = orders_collection.find_one({"orderId": data["orderId"]})
+    assert stored["priceCents"] == price_cents
+    assert stored["slaHours"] == sla_hours
+    assert stored["dueAt"] - stored["timestamp"] == timedelta(hours=sla_hours)
+
+
+async def test_generate_order_retries_on_id_collision(client, orders_collection, monkeypatch):
+    """A colliding order ID is rejected by the unique index and a new one is drawn"""
+    existing = (await create_order(client, "snap"))["orderId"]
+    ids = iter([existing, existing, "SS-FRESH001"])
+    monkeypatch.setattr(server, "new_order_id", lambda: next(ids))
+
+    data = await create_order(client, "snappack")
+
+    assert data["orderId"] == "SS-FRESH001"
+    assert orders_collection.count_documents({"orderId": existing}) == 1
+
+
+async def test_generate_order_gives_up_after_repeated_collisions(client, orders_collection, monkeypatch):
+    existing = (await create_order(client, "snap"))["orderId"]
+    monkeypatch.setattr(server, "new_order_id", lambda: existing)
+
+    response = await client.post("/api/generate-order", json={"plan": "snap"})
+
+    assert response.status_code == 500
+    assert orders_collection.count_documents({}) == 1
+
+
+async def test_generate_order_invalid_plan(client, orders_collection):
+    """Test that an unknown plan is rejected without storing anything"""
+    response = await client.post("/api/generate-order", json={"plan": "invalid_plan"})
+
+    assert response.status_code == 400, "Invalid plan should return 400"
+    assert orders_collection.count_documents({}) == 0
+
+
+@pytest.mark.parametrize(
+    "plan, plan_name, price, delivery",
+    [
+        ("snap", "Snap", "$3.99", "2 hours"),
+        ("snappack", "Snap Pack", "$9.99", "48 hours each"),
+        ("creator", "Creator Pack", "$24.99/mo", "Priority"),
+    ],
+)
+async def test_get_order(client, plan, plan_name, price, delivery):
+    """Test get order by ID endpoint for each plan"""
+    order_id = (await create_order(client, plan))["orderId"]
+
+    response = await client.get(f"/api/order/{order_id}")
+
+    assert response.status_code == 200, f"Get {plan} order should return 200"
+    data = response.json()
+    assert data["orderId"] == order_id
+    assert data["plan"] == plan
+    assert data["planName"] == plan_name
+    assert data["price"] == price
+    assert data["delivery"] == delivery
+    assert data["status"] == "payment_confirmed"
+    assert data["fulfilled"] is False
+    assert "_id" not in data, "MongoDB _id should not be exposed"
+
+
+async def test_get_order_not_found(client):
+    """Test get order for a non-existent ID"""
+    response = await client.get("/api/order/non-existent-id")
+
+    assert response.status_code == 404, "Non-existent order should return 404"
+
+
+async def test_list_orders(client):
+    """Test get all orders endpoint with filters"""
+    for plan in ("snap", "snap", "snappack", "creator"):
+        await create_order(client, plan)
+
+    response = await client.get("/api/orders")
+    assert response.status_code == 200, "Get orders should return 200"
+    data = response.json()
+    assert isinstance(data["orders"], list), "Orders should be a list"
+    assert data["count"] == 4
+    timestamps = [datetime.fromisoformat(order["timestamp"]) for order in data["orders"]]
+    assert timestamps == sorted(timestamps, reverse=True), "Orders should be newest first"
+
+    response = await client.get("/api/orders", params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()["orders"]) == 2, "Should return at most 2 orders"
+
+    response = await client.get("/api/orders", params={"fulfilled": "false"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 4
+    assert all(order["fulfilled"] is False for order in data["orders"])
+
+    response = await client.get("/api/orders", params={"plan": "snap"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert all(order["plan"] == "snap" for order in data["orders"])
+
+
+async def test_fulfill_order(client):
+    """Test fulfill order endpoint"""
+    order_id = (await create_order(client, "snap"))["orderId"]
+
+    response = await client.put(f"/api/order/{order_id}/fulfill")
+
+    assert response.status_code == 200, "Fulfill order should return 200"
+    data = response.json()
+    assert data["message"] == "Order fulfilled successfully"
+    assert data["orderId"] == order_id
+
+    response = await client.get(f"/api/order/{order_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["fulfilled"] is True, "Order should now be fulfilled"
+    assert "fulfilledAt" in data, "Should include fulfilledAt timestamp"
+
+
+async def test_fulfill_order_not_found(client):
+    """Test fulfilling a non-existent order"""
+    response = await client.put("/api/order/non-existent-id/fulfill")
+
+    assert response.status_code == 404, "Non-existent order should return 404"
+
+
+async def test_stats(client):
+    """Test stats endpoint"""
+    orders = [await create_order(client, plan) for plan in ("snap", "snap", "snappack", "creator")]
+    await client.put(f"/api/order/{orders[0]['orderId']}/fulfill")
+
+    response = await client.get("/api/stats")
+
+    assert response.status_code == 200, "Stats should return 200"
+    data = response.json()
+    assert data["totalOrders"] == 4
+    assert data["fulfilledOrders"] == 1
+    assert data["pendingOrders"] == 3
+    assert data["planBreakdown"] == {"snap": 2, "snappack": 1, "creator": 1}
+    assert data["revenueBreakdownCents"] == {"snap": 798, "snappack": 999, "creator": 2499}
+    assert data["revenueCents"] == 798 + 999 + 2499
+    assert data["overdueOrders"] == 0
+
+
+async def test_stats_counts_overdue_orders(client, orders_collection):
+    """Unfulfilled orders past their SLA are overdue; fulfilled ones never are"""
+    late, done = [(await create_order(client, "snap"))["orderId"] for _ in range(2)]
+    await create_order(client, "creator")
+    orders_collection.update_many(
+        {"orderId": {"$in": [late, done]}},
+        {"$set": {"dueAt": datetime.now() - timedelta(hours=1)}},
+    )
+    await client.put(f"/api/order/{done}/fulfill")
+
+    response = await client.get("/api/stats")
+
+    assert response.json()["overdueOrders"] == 1
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from plan_catalog import MONTHLY, ONE_TIME, PLANS, PLANS_PAYLOAD, format_price
+
+
+@pytest.mark.parametrize(
+    "price_cents, billing_period, expected",
+    [(399, ONE_TIME, "$3.99"), (2499, MONTHLY, "$24.99/mo"), (1000, ONE_TIME, "$10.00"), (5, ONE_TIME, "$0.05")],
+)
+def test_format_price(price_cents, billing_period, expected):
+    assert format_price(price_cents, billing_period) == expected
+
+
+def test_plans_are_read_only():
+    plan = PLANS["snap"]
+
+    with pytest.raises(AttributeError):
+        plan.price_cents = 0
+    with pytest.raises(AttributeError):
+        del plan.name
+    with pytest.raises(AttributeError):
+        plan.discount = 10
+    assert not hasattr(plan, "__dict__"), "Plans should be slotted"
+
+
+def test_payload_matches_catalog():
+    payload = json.loads(PLANS_PAYLOAD)
+
+    assert payload == {"plans": {key: plan.to_api() for key, plan in PLANS.items()}}
+
+
+def test_order_fields_are_numeric():
+    fields = PLANS["snappack"].order_fields()
+
+    assert fields["priceCents"] == 999
+    assert fields["slaHours"] == 48
+    assert fields["billingPeriod"] == ONE_TIME
+    assert fields["price"] == "$9.99"
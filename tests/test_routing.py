@@ -0,0 +1,117 @@
+"""Read/write routing tests.
+
+The replica set test is skipped unless MONGO_REPLSET_URL points at a real
+replica set, e.g. a local single-node one:
+
+    docker run -d -p 27017:27017 mongo:6.0 --replSet rs0
+    docker exec <container> mongosh --eval "rs.initiate()"
+    MONGO_REPLSET_URL="mongodb://localhost:27017/?replicaSet=rs0&directConnection=true" pytest tests/test_routing.py
+"""
+import os
+import uuid
+
+import mongomock
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pymongo import MongoClient
+from pymongo.read_preferences import Primary, Secondary, SecondaryPreferred
+
+import server
+
+MONGO_REPLSET_URL = os.environ.get("MONGO_REPLSET_URL")
+
+
+@pytest.fixture
+def default_routing(monkeypatch):
+    """Pin the routing settings to their defaults, whatever the environment says"""
+    monkeypatch.setattr(server, "ORDER_WRITE_CONCERN", "majority")
+    monkeypatch.setattr(server, "ANALYTICS_READ_PREFERENCE", "secondaryPreferred")
+    monkeypatch.setattr(server, "ANALYTICS_MAX_STALENESS_SECONDS", 90)
+
+
+def test_order_collection_uses_primary_and_write_concern_profile(default_routing):
+    orders, _ = server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+    assert orders.read_preference == Primary()
+    assert orders.write_concern == server.WRITE_CONCERN_PROFILES["majority"]
+
+
+def test_analytics_collection_reads_from_secondaries_with_bounded_staleness(default_routing):
+    _, analytics = server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+    assert analytics.read_preference == SecondaryPreferred(max_staleness=90)
+
+
+def test_routing_is_configurable(default_routing, monkeypatch):
+    monkeypatch.setattr(server, "ORDER_WRITE_CONCERN", "fast")
+    monkeypatch.setattr(server, "ANALYTICS_READ_PREFERENCE", "secondary")
+    monkeypatch.setattr(server, "ANALYTICS_MAX_STALENESS_SECONDS", 120)
+
+    orders, analytics = server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+    assert orders.write_concern == server.WRITE_CONCERN_PROFILES["fast"]
+    assert analytics.read_preference == Secondary(max_staleness=120)
+
+
+@pytest.mark.parametrize("seconds", [0, 30, 89, -2])
+def test_too_small_max_staleness_is_rejected(default_routing, monkeypatch, seconds):
+    monkeypatch.setattr(server, "ANALYTICS_MAX_STALENESS_SECONDS", seconds)
+
+    with pytest.raises(ValueError):
+        server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+
+def test_max_staleness_can_be_unbounded(default_routing, monkeypatch):
+    monkeypatch.setattr(server, "ANALYTICS_MAX_STALENESS_SECONDS", -1)
+
+    _, analytics = server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+    assert analytics.read_preference == SecondaryPreferred()
+
+
+def test_analytics_can_be_pinned_to_primary(default_routing, monkeypatch):
+    monkeypatch.setattr(server, "ANALYTICS_READ_PREFERENCE", "primary")
+
+    _, analytics = server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+    assert analytics.read_preference == Primary()
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [("ORDER_WRITE_CONCERN", "eventually"), ("ANALYTICS_READ_PREFERENCE", "anywhere")],
+)
+def test_unknown_routing_config_is_rejected(default_routing, monkeypatch, setting, value):
+    monkeypatch.setattr(server, setting, value)
+
+    with pytest.raises(ValueError):
+        server.build_order_collections(mongomock.MongoClient().songsnaps)
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not MONGO_REPLSET_URL, reason="MONGO_REPLSET_URL not set")
+async def test_routing_against_replica_set(monkeypatch):
+    """Orders are readable immediately after creation and stats see them"""
+    mongo_client = MongoClient(MONGO_REPLSET_URL)
+    database = mongo_client[f"songsnaps_test_{uuid.uuid4().hex[:8]}"]
+    orders, analytics = server.build_order_collections(database)
+    monkeypatch.setattr(server, "orders_collection", orders)
+    monkeypatch.setattr(server, "analytics_orders_collection", analytics)
+
+    try:
+        transport = ASGITransport(app=server.app)
+        async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.post("/api/generate-order", json={"plan": "snap"})
+            assert response.status_code == 200
+            order_id = response.json()["orderId"]
+
+            response = await client.get(f"/api/order/{order_id}")
+            assert response.status_code == 200
+            assert response.json()["orderId"] == order_id
+
+            response = await client.get("/api/stats")
+            assert response.status_code == 200
+            assert response.json()["totalOrders"] == 1
+    finally:
+        mongo_client.drop_database(database.name)
+        mongo_client.close()
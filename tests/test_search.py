@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def seeded_orders(orders_collection):
+    """Five orders one day apart, newest last"""
+    orders = [
+        ("SS-AB12CD34", "snap", False),
+        ("SS-AB99FF00", "snappack", True),
+        ("SS-CD12AB34", "snap", True),
+        ("SS-EF000001", "creator", False),
+        ("SS-AB12EEEE", "creator", False),
+    ]
+    for day, (order_id, plan, fulfilled) in enumerate(orders):
+        orders_collection.insert_one({
+            "orderId": order_id,
+            "plan": plan,
+            "status": "payment_confirmed",
+            "fulfilled": fulfilled,
+            "timestamp": BASE_TIME + timedelta(days=day),
+        })
+    return orders_collection
+
+
+async def search(client, **params):
+    response = await client.get("/api/orders/search", params=params)
+    assert response.status_code == 200
+    return [order["orderId"] for order in response.json()["orders"]]
+
+
+async def test_search_by_order_id_prefix(client, seeded_orders):
+    assert await search(client, orderId="SS-AB12") == ["SS-AB12EEEE", "SS-AB12CD34"]
+
+
+@pytest.mark.parametrize("prefix", ["ab12", "AB12", "ss-ab12", " AB12 "])
+async def test_search_normalises_quoted_ids(client, seeded_orders, prefix):
+    """Customers quote IDs in any case and often without the SS- prefix"""
+    assert await search(client, orderId=prefix) == ["SS-AB12EEEE", "SS-AB12CD34"]
+
+
+async def test_search_prefix_is_anchored(client, seeded_orders):
+    """'AB' must not match IDs that merely contain it, like SS-CD12AB34"""
+    assert "SS-CD12AB34" not in await search(client, orderId="AB")
+
+
+async def test_search_escapes_regex_characters(client, seeded_orders):
+    assert await search(client, orderId=".*") == []
+
+
+async def test_search_by_plan_and_fulfilled(client, seeded_orders):
+    assert await search(client, plan="snap") == ["SS-CD12AB34", "SS-AB12CD34"]
+    assert await search(client, plan="snap", fulfilled="true") == ["SS-CD12AB34"]
+
+
+async def test_search_by_status(client, seeded_orders):
+    assert len(await search(client, status="payment_confirmed")) == 5
+    assert await search(client, status="refunded") == []
+
+
+async def test_search_by_date_range(client, seeded_orders):
+    start = (BASE_TIME + timedelta(days=1)).isoformat()
+    end = (BASE_TIME + timedelta(days=3)).isoformat()
+
+    assert await search(client, start=start, end=end) == ["SS-EF000001", "SS-CD12AB34", "SS-AB99FF00"]
+    assert await search(client, start=start, end=end, plan="creator") == ["SS-EF000001"]
+
+
+async def test_search_accepts_utc_bounds(client, seeded_orders):
+    """Z-suffixed bounds are converted to the naive local time orders are stored in"""
+    def utc(value):
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    start = utc(BASE_TIME + timedelta(days=1))
+    end = (BASE_TIME + timedelta(days=3)).isoformat()
+
+    assert await search(client, start=start, end=end) == ["SS-EF000001", "SS-CD12AB34", "SS-AB99FF00"]
+    assert await search(client, start=start, end=utc(BASE_TIME + timedelta(days=1))) == ["SS-AB99FF00"]
+
+
+async def test_search_limit(client, seeded_orders):
+    assert len(await search(client, limit=2)) == 2
+
+    response = await client.get("/api/orders/search", params={"limit": server.MAX_SEARCH_RESULTS + 1})
+    assert response.status_code == 400
+
+
+async def test_search_rejects_inverted_date_range(client, seeded_orders):
+    response = await client.get(
+        "/api/orders/search",
+        params={"start": BASE_TIME.isoformat(), "end": (BASE_TIME - timedelta(days=1)).isoformat()},
+    )
+    assert response.status_code == 400
+
+
+def test_ensure_indexes(orders_collection):
+    server.ensure_indexes(orders_collection)
+    # Running twice is a no-op
+    server.ensure_indexes(orders_collection)
+
+    indexes = orders_collection.index_information()
+    assert indexes["orderId"]["key"] == [("orderId", 1)]
+    assert indexes["orderId"]["unique"] is True
+    assert indexes["plan_timestamp"]["key"] == [("plan", 1), ("timestamp", -1)]
+    assert indexes["status_timestamp"]["key"] == [("status", 1), ("timestamp", -1)]
+    assert indexes["fulfilled_timestamp"]["key"] == [("fulfilled", 1), ("timestamp", -1)]
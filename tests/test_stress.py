@@ -0,0 +1,55 @@
+import asyncio
+import os
+import random
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+PLANS = ["snap", "snappack", "creator"]
+
+# Orders per seed; kept small so the default run stays fast. For a real
+# stress run use e.g. STRESS_ORDERS=5000 pytest tests/test_stress.py
+STRESS_ORDERS = int(os.environ.get("STRESS_ORDERS", "300"))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+async def test_concurrent_create_and_fulfill(client, orders_collection, seed):
+    """Fire concurrent create/fulfill requests and check invariants"""
+    rng = random.Random(seed)
+    plans = [rng.choice(PLANS) for _ in range(STRESS_ORDERS)]
+
+    responses = await asyncio.gather(
+        *(client.post("/api/generate-order", json={"plan": plan}) for plan in plans)
+    )
+    assert all(response.status_code == 200 for response in responses)
+    order_ids = [response.json()["orderId"] for response in responses]
+
+    # Every order ID is unique (enforced by the orderId index) and stored exactly once
+    assert len(set(order_ids)) == len(order_ids)
+    assert orders_collection.count_documents({}) == len(order_ids)
+
+    # Fulfill a random subset concurrently, hitting some orders more than once
+    to_fulfill = rng.sample(order_ids, len(order_ids) // 2)
+    requests = to_fulfill + rng.sample(to_fulfill, len(to_fulfill) // 4)
+    rng.shuffle(requests)
+    responses = await asyncio.gather(
+        *(client.put(f"/api/order/{order_id}/fulfill") for order_id in requests)
+    )
+    assert all(response.status_code == 200 for response in responses)
+
+    response = await client.get("/api/stats")
+    assert response.status_code == 200
+    stats = response.json()
+
+    # Stats agree with both the requests we made and the stored documents
+    assert stats["totalOrders"] == len(order_ids) == orders_collection.count_documents({})
+    assert stats["fulfilledOrders"] == len(to_fulfill) == orders_collection.count_documents({"fulfilled": True})
+    assert stats["pendingOrders"] == stats["totalOrders"] - stats["fulfilledOrders"]
+    assert stats["planBreakdown"] == {
+        plan: orders_collection.count_documents({"plan": plan}) for plan in PLANS
+    }
+    assert stats["planBreakdown"] == {plan: plans.count(plan) for plan in PLANS}
+    assert stats["revenueCents"] == sum(server.PLANS[plan].price_cents for plan in plans)
@@ -0,0 +1,146 @@
+import atexit
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+import structured_logging
+from structured_logging import JsonFormatter, SamplingFilter, configure_logging, request_id_var
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    return logging.getLogger("test").makeRecord("test", level, __file__, 1, msg, args, None, extra=extra)
+
+
+def test_json_formatter_includes_extra_fields():
+    token = request_id_var.set("req-1")
+    try:
+        record = make_record(orderId="SS-12345678", sample=True)
+    finally:
+        request_id_var.reset(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "req-1"
+    assert entry["orderId"] == "SS-12345678"
+    assert "sample" not in entry, "Sampling marker is internal"
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.ERROR, __file__, 1, "failed", (), exc_info=sys.exc_info()
+        )
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert "RuntimeError: boom" in entry["exception"]
+
+
+def test_sampling_drops_marked_success_logs():
+    sampling = SamplingFilter(rate=0.0)
+
+    assert not sampling.filter(make_record(sample=True))
+    assert sampling.filter(make_record()), "Unmarked records are never sampled"
+
+
+@pytest.mark.parametrize("level", [logging.WARNING, logging.ERROR])
+def test_sampling_always_keeps_errors(level):
+    assert SamplingFilter(rate=0.0).filter(make_record(level=level, sample=True))
+
+
+def test_sampling_rate_is_roughly_respected():
+    sampling = SamplingFilter(rate=0.25)
+
+    kept = sum(sampling.filter(make_record(sample=True)) for _ in range(4000))
+
+    assert 700 < kept < 1300
+
+
+def test_sampling_decision_is_made_once_per_request():
+    """All sampled lines of a request are kept or dropped together"""
+    sampling = SamplingFilter(rate=0.5)
+    decisions = []
+    for i in range(2000):
+        token = request_id_var.set(f"request-{i}")
+        try:
+            records = [make_record(sample=True), make_record(msg="Request completed", args=(), sample=True)]
+        finally:
+            request_id_var.reset(token)
+        kept = [sampling.filter(record) for record in records]
+        assert kept[0] == kept[1]
+        decisions.append(kept[0])
+
+    assert 800 < sum(decisions) < 1200
+
+
+@pytest.fixture
+def restore_root_logger(monkeypatch):
+    monkeypatch.setattr(structured_logging, "active_sampling", structured_logging.active_sampling)
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def test_pipeline_writes_json_from_background_thread(restore_root_logger):
+    stream = io.StringIO()
+    listener = configure_logging(level="INFO", sample_rate=0.0, stream=stream)
+    logger = logging.getLogger("pipeline")
+
+    logger.info("Order created", extra={"orderId": "SS-1", "sample": True})
+    logger.info("Kept %s", "always")
+    logger.error("Failed: %s", "boom", extra={"sample": True})
+    atexit.unregister(listener.stop)
+    listener.stop()
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [entry["message"] for entry in entries] == ["Kept always", "Failed: boom"]
+    assert entries[1]["level"] == "ERROR"
+
+
+@pytest.mark.anyio
+async def test_requests_are_tagged_and_timed(client, caplog):
+    with caplog.at_level(logging.INFO, logger="server"):
+        response = await client.post("/api/generate-order", json={"plan": "snap"})
+
+    request_id = response.headers["X-Request-ID"]
+    records = [record for record in caplog.records if record.name == "server"]
+    created = next(record for record in records if record.getMessage() == "Order created successfully")
+    completed = next(record for record in records if record.getMessage() == "Request completed")
+
+    assert created.request_id == request_id
+    assert completed.request_id == request_id
+    assert completed.status == 200
+    assert completed.path == "/api/generate-order"
+    assert completed.durationMs >= 0
+
+
+@pytest.mark.anyio
+async def test_sampled_out_requests_skip_the_completion_log(client, caplog, monkeypatch):
+    monkeypatch.setattr(structured_logging, "active_sampling", SamplingFilter(rate=0.0))
+
+    with caplog.at_level(logging.INFO, logger="server"):
+        ok = await client.get("/api/health")
+        missing = await client.get("/api/order/non-existent-id")
+
+    assert ok.status_code == 200 and missing.status_code == 404
+    completed = [record for record in caplog.records if record.getMessage() == "Request completed"]
+    assert [record.status for record in completed] == [404], "Only the failed request is logged"
+
+
+@pytest.mark.anyio
+async def test_incoming_request_id_is_reused(client):
+    response = await client.get("/api/health", headers={"X-Request-ID": "abc123"})
+
+    assert response.headers["X-Request-ID"] == "abc123"